@@ -120,9 +120,10 @@ def execute_code(code: str) -> str:
         code: The shell command to execute.
 
     """
+    args = code.split()
     try:
         result = subprocess.run(
-            code.split(),
+            args,
             capture_output=True,
             text=True,
             check=True,
@@ -131,7 +132,7 @@ def execute_code(code: str) -> str:
     except subprocess.CalledProcessError as e:
         return f"Error executing code: {e.stderr}"
     except FileNotFoundError:
-        return f"Error: Command not found: {code.split()[0]}"
+        return f"Error: Command not found: {args[0]}"
 
 
 def add_memory(content: str, category: str = "general", tags: str = "") -> str:
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 from agent_cli import tts
@@ -11,6 +10,7 @@ from agent_cli.utils import InteractiveStopEvent, print_with_style
 
 if TYPE_CHECKING:
     import logging
+    from pathlib import Path
 
     from rich.live import Live
 
@@ -24,8 +24,7 @@ async def _save_audio_file(
     description: str = "Audio",
 ) -> None:
     try:
-        save_path = Path(save_file)
-        await asyncio.to_thread(save_path.write_bytes, audio_data)
+        await asyncio.to_thread(save_file.write_bytes, audio_data)
         if not quiet:
             print_with_style(f"💾 {description} saved to {save_file}")
         logger.info("%s saved to %s", description, save_file)
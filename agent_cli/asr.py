@@ -21,6 +21,15 @@ if TYPE_CHECKING:
     import pyaudio
     from rich.live import Live
 
+# These events never change, so every recording session shares them
+_TRANSCRIBE_EVENT = Transcribe().event()
+_AUDIO_START_EVENT = AudioStart(
+    rate=config.PYAUDIO_RATE,
+    width=2,
+    channels=config.PYAUDIO_CHANNELS,
+).event()
+_AUDIO_STOP_EVENT = AudioStop().event()
+
 
 async def send_audio(
     client: AsyncClient,
@@ -42,11 +51,8 @@ async def send_audio(
         quiet: If True, suppress all console output
 
     """
-    await client.write_event(Transcribe().event())
-
-    await client.write_event(
-        AudioStart(rate=config.PYAUDIO_RATE, width=2, channels=config.PYAUDIO_CHANNELS).event(),
-    )
+    await client.write_event(_TRANSCRIBE_EVENT)
+    await client.write_event(_AUDIO_START_EVENT)
 
     try:
         seconds_streamed = 0.0
@@ -77,7 +83,7 @@ async def send_audio(
                     live.update(Text(f"Listening... ({seconds_streamed:.1f}s)", style="blue"))
 
     finally:
-        await client.write_event(AudioStop().event())
+        await client.write_event(_AUDIO_STOP_EVENT)
         logger.debug("Sent AudioStop")
 
 
@@ -124,6 +130,26 @@ async def receive_text(
     return transcript_text
 
 
+async def _receive_then_stop(
+    client: AsyncClient,
+    logger: logging.Logger,
+    stop_event: InteractiveStopEvent,
+    *,
+    chunk_callback: Callable[[str], None] | None,
+    final_callback: Callable[[str], None] | None,
+) -> str:
+    """Receive the transcript, then stop recording even if the server went away."""
+    try:
+        return await receive_text(
+            client,
+            logger,
+            chunk_callback=chunk_callback,
+            final_callback=final_callback,
+        )
+    finally:
+        stop_event.set()
+
+
 async def transcribe_audio(
     asr_server_ip: str,
     asr_server_port: int,
@@ -171,31 +197,33 @@ async def transcribe_audio(
                 frames_per_buffer=config.PYAUDIO_CHUNK_SIZE,
                 input_device_index=input_device_index,
             ) as stream:
-                send_task = asyncio.create_task(
-                    send_audio(
-                        client,
-                        stream,
-                        stop_event,
-                        logger,
-                        live=live,
-                        quiet=quiet,
-                    ),
-                )
-                recv_task = asyncio.create_task(
-                    receive_text(
-                        client,
-                        logger,
-                        chunk_callback=chunk_callback,
-                        final_callback=final_callback,
-                    ),
-                )
-
-                done, pending = await asyncio.wait(
-                    [send_task, recv_task],
-                    return_when=asyncio.ALL_COMPLETED,
-                )
-                for task in pending:
-                    task.cancel()
+                try:
+                    async with asyncio.TaskGroup() as tg:
+                        tg.create_task(
+                            send_audio(
+                                client,
+                                stream,
+                                stop_event,
+                                logger,
+                                live=live,
+                                quiet=quiet,
+                            ),
+                        )
+                        recv_task = tg.create_task(
+                            _receive_then_stop(
+                                client,
+                                logger,
+                                stop_event,
+                                chunk_callback=chunk_callback,
+                                final_callback=final_callback,
+                            ),
+                        )
+                except ExceptionGroup as eg:
+                    # Surface the first error to the handlers below and log the rest
+                    first, *others = eg.exceptions
+                    for exc in others:
+                        logger.exception("Additional transcription error", exc_info=exc)
+                    raise first from None
 
                 return recv_task.result()
 
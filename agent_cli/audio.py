@@ -74,9 +74,10 @@ def get_device_by_index(p: pyaudio.PyAudio, input_device_index: int) -> dict:
         ValueError: If device index is not found
 
     """
-    for device in get_all_devices(p):
-        if device["index"] == input_device_index:
-            return device
+    devices = get_all_devices(p)
+    # `get_all_devices` stores each device at the position matching its index
+    if 0 <= input_device_index < len(devices):
+        return devices[input_device_index]
     msg = f"Device index {input_device_index} not found"
     raise ValueError(msg)
 
@@ -0,0 +1,25 @@
+"""Shared fixtures for the agent tests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.mocks.wyoming import MockASRClient
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+@pytest.fixture(scope="module")
+def _module_asr_client(transcript_responses: Mapping[str, str]) -> MockASRClient:
+    """Build the canned ASR client once per module."""
+    return MockASRClient(transcript_responses["hello"])
+
+
+@pytest.fixture
+def canned_asr_client(_module_asr_client: MockASRClient) -> MockASRClient:
+    """Provide the module's ASR client, reset to its initial state."""
+    _module_asr_client.reset()
+    return _module_asr_client
@@ -4,15 +4,18 @@ from __future__ import annotations
 
 import io
 from contextlib import redirect_stdout
+from typing import TYPE_CHECKING, cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from rich.console import Console
 
 from agent_cli import config
 from agent_cli.agents import autocorrect
 from agent_cli.agents._config import GeneralConfig, LLMConfig
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 
 def test_system_prompt_and_instructions():
     """Test that the system prompt and instructions are properly defined."""
@@ -28,39 +31,42 @@ def test_system_prompt_and_instructions():
 def test_display_result_quiet_mode():
     """Test the _display_result function in quiet mode with real output."""
     # Test normal correction
-    with patch("agent_cli.agents.autocorrect.pyperclip.copy") as mock_copy:
-        output = io.StringIO()
-        with redirect_stdout(output):
-            autocorrect._display_result(
-                "Hello world!",
-                "hello world",
-                0.1,
-                simple_output=True,
-            )
-
-        assert output.getvalue().strip() == "Hello world!"
-        mock_copy.assert_called_once_with("Hello world!")
+    output = io.StringIO()
+    with (
+        patch("agent_cli.agents.autocorrect.pyperclip.copy") as mock_copy,
+        redirect_stdout(output),
+    ):
+        autocorrect._display_result(
+            "Hello world!",
+            "hello world",
+            0.1,
+            simple_output=True,
+        )
+
+    assert output.getvalue().strip() == "Hello world!"
+    mock_copy.assert_called_once_with("Hello world!")
 
 
 def test_display_result_no_correction_needed():
     """Test the _display_result function when no correction is needed."""
-    with patch("agent_cli.agents.autocorrect.pyperclip.copy") as mock_copy:
-        output = io.StringIO()
-        with redirect_stdout(output):
-            autocorrect._display_result(
-                "Hello world!",
-                "Hello world!",
-                0.1,
-                simple_output=True,
-            )
-
-        assert output.getvalue().strip() == "✅ No correction needed."
-        mock_copy.assert_called_once_with("Hello world!")
+    output = io.StringIO()
+    with (
+        patch("agent_cli.agents.autocorrect.pyperclip.copy") as mock_copy,
+        redirect_stdout(output),
+    ):
+        autocorrect._display_result(
+            "Hello world!",
+            "Hello world!",
+            0.1,
+            simple_output=True,
+        )
+
+    assert output.getvalue().strip() == "✅ No correction needed."
+    mock_copy.assert_called_once_with("Hello world!")
 
 
-def test_display_result_verbose_mode():
+def test_display_result_verbose_mode(mock_console: Console) -> None:
     """Test the _display_result function in verbose mode with real console output."""
-    mock_console = Console(file=io.StringIO(), width=80)
     with (
         patch("agent_cli.utils.console", mock_console),
         patch("agent_cli.agents.autocorrect.pyperclip.copy") as mock_copy,
@@ -72,30 +78,28 @@ def test_display_result_verbose_mode():
             simple_output=False,
         )
 
-        output = mock_console.file.getvalue()
+        output = cast("io.StringIO", mock_console.file).getvalue()
         assert "Hello world!" in output
         assert "Corrected Text" in output
         assert "Success!" in output
         mock_copy.assert_called_once_with("Hello world!")
 
 
-def test_display_original_text():
+def test_display_original_text(mock_console: Console) -> None:
     """Test the display_original_text function."""
-    mock_console = Console(file=io.StringIO(), width=80)
     with patch("agent_cli.utils.console", mock_console):
         autocorrect.display_original_text("Test text here", quiet=False)
-        output = mock_console.file.getvalue()
+        output = cast("io.StringIO", mock_console.file).getvalue()
         assert "Test text here" in output
         assert "Original Text" in output
 
 
-def test_display_original_text_none_console():
+def test_display_original_text_none_console(mock_console: Console) -> None:
     """Test display_original_text with None console (should not crash)."""
-    mock_console = Console(file=io.StringIO(), width=80)
     with patch("agent_cli.utils.console", mock_console):
         # This should not raise an exception or print anything
         autocorrect.display_original_text("Test text", quiet=True)
-        assert mock_console.file.getvalue() == ""
+        assert cast("io.StringIO", mock_console.file).getvalue() == ""
 
 
 @pytest.mark.asyncio
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -23,7 +24,7 @@ from agent_cli.agents.interactive import (
     _save_conversation_history,
     async_main,
 )
-from agent_cli.utils import InteractiveStopEvent
+from tests.mocks.stubs import StubStopEvent
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -77,37 +78,51 @@ def test_format_conversation_for_llm() -> None:
     assert "assistant (4 minutes ago): It's sunny." in formatted
 
 
+@pytest.fixture
+def sample_configs(tmp_path: Path) -> dict[str, Any]:
+    """Build fresh configs for the device-listing tests.
+
+    Tests that need a different value use `dataclasses.replace` on a single config.
+    """
+    return {
+        "general_cfg": GeneralConfig(
+            log_level="INFO",
+            log_file=None,
+            quiet=False,
+            clipboard=False,
+        ),
+        "asr_config": ASRConfig(
+            server_ip="localhost",
+            server_port=1234,
+            input_device_index=None,
+            input_device_name=None,
+            list_input_devices=False,
+        ),
+        "llm_config": LLMConfig(model="test-model", ollama_host="localhost"),
+        "tts_config": TTSConfig(
+            enabled=False,
+            server_ip="localhost",
+            server_port=5678,
+            voice_name=None,
+            language=None,
+            speaker=None,
+            output_device_index=None,
+            output_device_name=None,
+            list_output_devices=False,
+            speed=1.0,
+        ),
+        "file_config": FileConfig(
+            save_file=None,
+            history_dir=tmp_path,
+        ),
+    }
+
+
 @pytest.mark.asyncio
-async def test_async_main_list_devices(tmp_path: Path) -> None:
+async def test_async_main_list_devices(sample_configs: dict[str, Any]) -> None:
     """Test the async_main function with list_input_devices=True."""
-    general_cfg = GeneralConfig(
-        log_level="INFO",
-        log_file=None,
-        quiet=False,
-        clipboard=False,
-    )
-    general_cfg.__dict__["console"] = MagicMock()
-    asr_config = ASRConfig(
-        server_ip="localhost",
-        server_port=1234,
-        input_device_index=None,
-        input_device_name=None,
-        list_input_devices=True,
-    )
-    llm_config = LLMConfig(model="test-model", ollama_host="localhost")
-    tts_config = TTSConfig(
-        enabled=False,
-        server_ip="localhost",
-        server_port=5678,
-        voice_name=None,
-        language=None,
-        speaker=None,
-        output_device_index=None,
-        output_device_name=None,
-        list_output_devices=False,
-        speed=1.0,
-    )
-    file_config = FileConfig(save_file=None, history_dir=tmp_path)
+    sample_configs["general_cfg"].__dict__["console"] = MagicMock()
+    asr_config = dataclasses.replace(sample_configs["asr_config"], list_input_devices=True)
 
     with (
         patch("agent_cli.agents.interactive.pyaudio_context"),
@@ -115,46 +130,14 @@ async def test_async_main_list_devices(tmp_path: Path) -> None:
             "agent_cli.agents.interactive.list_input_devices",
         ) as mock_list_input_devices,
     ):
-        await async_main(
-            general_cfg=general_cfg,
-            asr_config=asr_config,
-            llm_config=llm_config,
-            tts_config=tts_config,
-            file_config=file_config,
-        )
+        await async_main(**(sample_configs | {"asr_config": asr_config}))
         mock_list_input_devices.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_async_main_list_output_devices(tmp_path: Path) -> None:
+async def test_async_main_list_output_devices(sample_configs: dict[str, Any]) -> None:
     """Test the async_main function with list_output_devices_flag=True."""
-    general_cfg = GeneralConfig(
-        log_level="INFO",
-        log_file=None,
-        quiet=False,
-        clipboard=False,
-    )
-    asr_config = ASRConfig(
-        server_ip="localhost",
-        server_port=1234,
-        input_device_index=None,
-        input_device_name=None,
-        list_input_devices=False,
-    )
-    llm_config = LLMConfig(model="test-model", ollama_host="localhost")
-    tts_config = TTSConfig(
-        enabled=False,
-        server_ip="localhost",
-        server_port=5678,
-        voice_name=None,
-        language=None,
-        speaker=None,
-        output_device_index=None,
-        output_device_name=None,
-        list_output_devices=True,
-        speed=1.0,
-    )
-    file_config = FileConfig(save_file=None, history_dir=tmp_path)
+    tts_config = dataclasses.replace(sample_configs["tts_config"], list_output_devices=True)
 
     with (
         patch("agent_cli.agents.interactive.pyaudio_context"),
@@ -162,13 +145,7 @@ async def test_async_main_list_output_devices(tmp_path: Path) -> None:
             "agent_cli.agents.interactive.list_output_devices",
         ) as mock_list_output_devices,
     ):
-        await async_main(
-            general_cfg=general_cfg,
-            asr_config=asr_config,
-            llm_config=llm_config,
-            tts_config=tts_config,
-            file_config=file_config,
-        )
+        await async_main(**(sample_configs | {"tts_config": tts_config}))
         mock_list_output_devices.assert_called_once()
 
 
@@ -206,33 +183,29 @@ async def test_async_main_full_loop(tmp_path: Path) -> None:
     )
     file_config = FileConfig(save_file=None, history_dir=history_dir)
 
+    # Simulate a single loop by controlling the stop event's is_set sequence
+    stop_event = StubStopEvent([False, True])  # Run loop once, then stop
+    mock_llm_response = AsyncMock(return_value="Mocked response")
+    mock_tts = AsyncMock()
+    mock_signal = MagicMock()
+    mock_signal.return_value.__enter__.return_value = stop_event
+
     with (
-        patch("agent_cli.agents.interactive.pyaudio_context"),
-        patch("agent_cli.agents.interactive._setup_input_device", return_value=(1, "mock_input")),
-        patch("agent_cli.agents.interactive._setup_output_device", return_value=(1, "mock_output")),
+        patch.multiple(
+            "agent_cli.agents.interactive",
+            pyaudio_context=MagicMock(),
+            _setup_input_device=MagicMock(return_value=(1, "mock_input")),
+            _setup_output_device=MagicMock(return_value=(1, "mock_output")),
+            get_llm_response=mock_llm_response,
+            handle_tts_playback=mock_tts,
+            signal_handling_context=mock_signal,
+        ),
         patch(
             "agent_cli.agents.interactive.asr.transcribe_audio",
             new_callable=AsyncMock,
+            return_value="Mocked instruction",
         ) as mock_transcribe,
-        patch(
-            "agent_cli.agents.interactive.get_llm_response",
-            new_callable=AsyncMock,
-        ) as mock_llm_response,
-        patch(
-            "agent_cli.agents.interactive.handle_tts_playback",
-            new_callable=AsyncMock,
-        ) as mock_tts,
-        patch("agent_cli.agents.interactive.signal_handling_context") as mock_signal,
     ):
-        # Simulate a single loop by controlling the mock stop_event's is_set method
-        mock_stop_event = MagicMock(spec=InteractiveStopEvent)
-        mock_stop_event.is_set.side_effect = [False, True]  # Run loop once, then stop
-        mock_stop_event.clear = MagicMock()  # Mock the clear method
-
-        mock_transcribe.return_value = "Mocked instruction"
-        mock_llm_response.return_value = "Mocked response"
-        mock_signal.return_value.__enter__.return_value = mock_stop_event
-
         await async_main(
             general_cfg=general_cfg,
             asr_config=asr_config,
@@ -244,7 +217,7 @@ async def test_async_main_full_loop(tmp_path: Path) -> None:
         # Verify that the core functions were called
         mock_transcribe.assert_called_once()
         mock_llm_response.assert_called_once()
-        assert mock_stop_event.clear.call_count == 2  # Called after ASR and at end of turn
+        assert stop_event.clear_count == 2  # Called after ASR and at end of turn
         mock_tts.assert_called_with(
             "Mocked response",
             tts_server_ip="localhost",
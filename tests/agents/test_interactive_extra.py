@@ -1,5 +1,7 @@
 """Tests for the interactive agent."""
 
+from collections.abc import Generator
+from contextlib import nullcontext
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -18,6 +20,16 @@ from agent_cli.agents.interactive import (
 from agent_cli.cli import app
 from agent_cli.utils import InteractiveStopEvent
 
+runner = CliRunner()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _no_pid_file() -> Generator[None, None, None]:
+    """Skip writing a PID file for every CLI invocation in this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("agent_cli.agents.interactive.process_manager.pid_file_context", nullcontext)
+        yield
+
 
 def test_setup_output_device():
     """Test the _setup_output_device function."""
@@ -91,7 +103,6 @@ async def test_handle_conversation_turn_no_instruction():
 
 def test_interactive_command_stop_and_status():
     """Test the stop and status flags of the interactive command."""
-    runner = CliRunner()
     with patch(
         "agent_cli.agents.interactive.stop_or_status_or_toggle",
         return_value=True,
@@ -121,7 +132,6 @@ def test_interactive_command_stop_and_status():
 
 def test_interactive_command_list_output_devices():
     """Test the list-output-devices flag."""
-    runner = CliRunner()
     with (
         patch(
             "agent_cli.agents.interactive.list_output_devices",
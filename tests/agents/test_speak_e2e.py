@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
@@ -9,33 +10,30 @@ import pytest
 
 from agent_cli.agents._config import FileConfig, GeneralConfig, TTSConfig
 from agent_cli.agents.speak import async_main
-from tests.mocks.audio import MockPyAudio
 from tests.mocks.wyoming import MockTTSClient
 
 if TYPE_CHECKING:
     from rich.console import Console
 
+    from tests.conftest import ClientPatcher
+    from tests.mocks.audio import MockPyAudio
+
 
 @pytest.mark.asyncio
 @patch("agent_cli.tts.pyaudio_context")
 @patch("agent_cli.agents.speak.pyaudio_context")
-@patch("agent_cli.tts.AsyncClient")
 async def test_speak_e2e(
-    mock_async_client_class: MagicMock,
     mock_pyaudio_context_speak: MagicMock,
     mock_pyaudio_context_tts: MagicMock,
-    mock_pyaudio_device_info: list[dict],
+    mock_pyaudio: MockPyAudio,
     mock_console: Console,
+    timeout_seconds: float,
+    wyoming_client_patcher: ClientPatcher,
 ) -> None:
     """Test end-to-end speech synthesis with simplified mocks."""
     # Setup mock PyAudio
-    mock_pyaudio_instance = MockPyAudio(mock_pyaudio_device_info)
-    mock_pyaudio_context_speak.return_value.__enter__.return_value = mock_pyaudio_instance
-    mock_pyaudio_context_tts.return_value.__enter__.return_value = mock_pyaudio_instance
-
-    # Setup mock Wyoming client
-    mock_tts_client = MockTTSClient(b"fake audio data")
-    mock_async_client_class.from_uri.return_value.__aenter__.return_value = mock_tts_client
+    mock_pyaudio_context_speak.return_value.__enter__.return_value = mock_pyaudio
+    mock_pyaudio_context_tts.return_value.__enter__.return_value = mock_pyaudio
 
     general_cfg = GeneralConfig(
         log_level="INFO",
@@ -57,13 +55,18 @@ async def test_speak_e2e(
     )
     file_config = FileConfig(save_file=None)
 
-    await async_main(
-        general_cfg=general_cfg,
-        text="Hello, world!",
-        tts_config=tts_config,
-        file_config=file_config,
-    )
+    with wyoming_client_patcher(
+        "agent_cli.tts",
+        MockTTSClient(b"fake audio data"),
+    ) as mock_async_client_class:
+        async with asyncio.timeout(timeout_seconds):
+            await async_main(
+                general_cfg=general_cfg,
+                text="Hello, world!",
+                tts_config=tts_config,
+                file_config=file_config,
+            )
 
     # Verify that the audio was "played"
     mock_async_client_class.from_uri.assert_called_once_with("tcp://mock-host:10200")
-    assert mock_pyaudio_instance.streams[0].get_written_data()
+    assert mock_pyaudio.streams[0].get_written_data()
@@ -4,44 +4,51 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from contextlib import ExitStack
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from agent_cli.agents import transcribe
 from agent_cli.agents._config import ASRConfig, GeneralConfig, LLMConfig
-from tests.mocks.wyoming import MockASRClient
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from tests.conftest import ClientPatcher
+    from tests.mocks.wyoming import MockASRClient
+
+
+@pytest.fixture
+def transcribe_mocks(
+    canned_asr_client: MockASRClient,
+    wyoming_client_patcher: ClientPatcher,
+) -> Generator[SimpleNamespace, None, None]:
+    """Patch the transcribe agent's collaborators with a single exit stack."""
+    stop_event = asyncio.Event()
+    stop_event.set()
+    with ExitStack() as stack:
+        mocks = SimpleNamespace(
+            async_client_class=stack.enter_context(
+                wyoming_client_patcher("agent_cli.asr", canned_asr_client),
+            ),
+            pyperclip=stack.enter_context(patch("agent_cli.agents.transcribe.pyperclip")),
+            signal_handling_context=stack.enter_context(
+                patch("agent_cli.agents.transcribe.signal_handling_context"),
+            ),
+        )
+        mocks.signal_handling_context.return_value.__enter__.return_value = stop_event
+        yield mocks
 
 
 @pytest.mark.asyncio
-@patch("agent_cli.asr.AsyncClient")
-@patch("agent_cli.agents.transcribe.pyperclip")
-@patch("agent_cli.agents.transcribe.pyaudio_context")
-@patch("agent_cli.agents.transcribe.input_device")
-@patch("agent_cli.agents.transcribe.signal_handling_context")
 async def test_transcribe_main(
-    mock_signal_handling_context: MagicMock,
-    mock_input_device: MagicMock,
-    mock_pyaudio_context: MagicMock,
-    mock_pyperclip: MagicMock,
-    mock_async_client_class: MagicMock,
+    transcribe_mocks: SimpleNamespace,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test the main function of the transcribe agent."""
-    # Mock the pyaudio context manager
-    mock_pyaudio_instance = MagicMock()
-    mock_pyaudio_context.return_value.__enter__.return_value = mock_pyaudio_instance
-
-    # Mock the Wyoming client
-    mock_asr_client = MockASRClient("hello world")
-    mock_async_client_class.from_uri.return_value = mock_asr_client
-    mock_input_device.return_value = (None, None)
-
-    # Setup stop event
-    stop_event = asyncio.Event()
-    mock_signal_handling_context.return_value.__enter__.return_value = stop_event
-    asyncio.get_event_loop().call_later(0.1, stop_event.set)
-
     # The function we are testing
     with caplog.at_level(logging.INFO):
         asr_config = ASRConfig(
@@ -63,10 +70,10 @@ async def test_transcribe_main(
             general_cfg=general_cfg,
             llm_config=llm_config,
             llm_enabled=False,
-            p=mock_pyaudio_instance,
+            p=MagicMock(),
         )
 
     # Assertions
     assert "Copied transcript to clipboard." in caplog.text
-    mock_pyperclip.copy.assert_called_once_with("hello world")
-    mock_async_client_class.from_uri.assert_called_once_with("tcp://localhost:12345")
+    transcribe_mocks.pyperclip.copy.assert_called_once_with("hello world")
+    transcribe_mocks.async_client_class.from_uri.assert_called_once_with("tcp://localhost:12345")
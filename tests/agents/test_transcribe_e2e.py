@@ -10,38 +10,62 @@ import pytest
 
 from agent_cli.agents._config import ASRConfig, GeneralConfig, LLMConfig
 from agent_cli.agents.transcribe import async_main
-from tests.mocks.audio import MockPyAudio
+from tests.mocks.llm import MockLLMAgent
 from tests.mocks.wyoming import MockASRClient
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from rich.console import Console
 
+    from tests.conftest import ClientPatcher
+    from tests.mocks.audio import MockPyAudio
+
 
 @pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("transcript_key", "llm_enabled", "connection_error", "expected"),
+    [
+        pytest.param("hello", False, False, "hello world", id="basic"),
+        pytest.param("hello", True, False, "This text has been corrected", id="llm-correction"),
+        pytest.param("empty", False, False, "No transcript captured", id="empty-result"),
+        pytest.param("hello", False, True, "ASR Connection refused", id="connection-error"),
+    ],
+)
+@patch("agent_cli.llm.build_agent")
 @patch("agent_cli.agents.transcribe.signal_handling_context")
-@patch("agent_cli.asr.AsyncClient")
 @patch("agent_cli.audio.pyaudio.PyAudio")
 async def test_transcribe_e2e(
     mock_pyaudio_class: MagicMock,
-    mock_async_client_class: MagicMock,
     mock_signal_handling_context: MagicMock,
-    mock_pyaudio_device_info: list[dict],
+    mock_build_agent: MagicMock,
+    transcript_key: str,
+    llm_enabled: bool,
+    connection_error: bool,
+    expected: str,
+    mock_pyaudio: MockPyAudio,
+    transcript_responses: Mapping[str, str],
+    llm_responses: Mapping[str, str],
+    wyoming_client_patcher: ClientPatcher,
     mock_console: Console,
+    timeout_seconds: float,
 ) -> None:
-    """Test end-to-end transcription with simplified mocks."""
+    """Test end-to-end transcription scenarios with simplified mocks."""
     # Setup mock PyAudio
-    mock_pyaudio_instance = MockPyAudio(mock_pyaudio_device_info)
-    mock_pyaudio_class.return_value = mock_pyaudio_instance
+    mock_pyaudio_class.return_value = mock_pyaudio
 
-    # Setup mock Wyoming client
-    transcript_text = "This is a test transcription."
-    mock_asr_client = MockASRClient(transcript_text)
-    mock_async_client_class.from_uri.return_value = mock_asr_client
+    # Setup mock Wyoming client and LLM agent
+    asr_client = (
+        ConnectionRefusedError()
+        if connection_error
+        else MockASRClient(transcript_responses[transcript_key])
+    )
+    mock_build_agent.return_value = MockLLMAgent(llm_responses)
 
     # Setup stop event
     stop_event = asyncio.Event()
+    stop_event.set()
     mock_signal_handling_context.return_value.__enter__.return_value = stop_event
-    asyncio.get_event_loop().call_later(0.1, stop_event.set)
 
     asr_config = ASRConfig(
         server_ip="mock-host",
@@ -56,20 +80,25 @@ async def test_transcribe_e2e(
         quiet=False,
         clipboard=False,
     )
-    llm_config = LLMConfig(model="", ollama_host="")
+    llm_config = LLMConfig(model="test-model", ollama_host="http://localhost:11434")
 
-    with patch("agent_cli.utils.console", mock_console):
-        await async_main(
-            asr_config=asr_config,
-            general_cfg=general_cfg,
-            llm_config=llm_config,
-            llm_enabled=False,
-            p=mock_pyaudio_instance,
-        )
+    with (
+        wyoming_client_patcher("agent_cli.asr", asr_client) as mock_async_client_class,
+        patch("agent_cli.utils.console", mock_console),
+    ):
+        async with asyncio.timeout(timeout_seconds):
+            await async_main(
+                asr_config=asr_config,
+                general_cfg=general_cfg,
+                llm_config=llm_config,
+                llm_enabled=llm_enabled,
+                p=mock_pyaudio,
+            )
 
-    # Assert that the final transcript is in the console output
+    # Assert that the expected result is in the console output
     output = mock_console.file.getvalue()
-    assert transcript_text in output
+    assert expected in output
 
-    # Ensure the mock client was used
-    mock_async_client_class.from_uri.assert_called_once()
+    # Ensure the mock client (and the LLM, when enabled) was used
+    mock_async_client_class.from_uri.assert_called_once_with("tcp://mock-host:10300")
+    assert mock_build_agent.called is llm_enabled
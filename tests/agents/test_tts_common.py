@@ -2,24 +2,33 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import logging
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from agent_cli.agents._tts_common import handle_tts_playback
+from agent_cli.agents._tts_common import _save_audio_file, handle_tts_playback
 
-if TYPE_CHECKING:
-    from pathlib import Path
+# Shared by every test; nothing asserts on the logger, so a real one is enough
+LOGGER = logging.getLogger(__name__)
 
 
 @pytest.mark.asyncio
+@pytest.mark.parametrize("audio_data", [b"audio data", None], ids=["audio", "no-audio"])
+@pytest.mark.parametrize("save", [False, True], ids=["play", "save"])
 @patch("agent_cli.agents._tts_common.tts.speak_text", new_callable=AsyncMock)
-async def test_handle_tts_playback(mock_speak_text: AsyncMock) -> None:
-    """Test the handle_tts_playback function."""
-    mock_speak_text.return_value = b"audio data"
+async def test_handle_tts_playback(
+    mock_speak_text: AsyncMock,
+    audio_data: bytes | None,
+    save: bool,
+) -> None:
+    """Test the handle_tts_playback function with and without audio and file saving."""
+    mock_speak_text.return_value = audio_data
+    save_file = MagicMock(spec=Path) if save else None
     mock_live = MagicMock()
-    await handle_tts_playback(
+
+    result = await handle_tts_playback(
         text="hello",
         tts_server_ip="localhost",
         tts_server_port=1234,
@@ -27,14 +36,15 @@ async def test_handle_tts_playback(mock_speak_text: AsyncMock) -> None:
         tts_language="en",
         speaker=None,
         output_device_index=1,
-        save_file=None,
+        save_file=save_file,
         quiet=False,
-        logger=MagicMock(),
+        logger=LOGGER,
         play_audio=True,
         speed=1.0,
         live=mock_live,
     )
 
+    assert result == audio_data
     mock_speak_text.assert_called_once_with(
         text="hello",
         tts_server_ip="localhost",
@@ -51,59 +61,49 @@ async def test_handle_tts_playback(mock_speak_text: AsyncMock) -> None:
         live=mock_live,
     )
 
+    # Verify the file is only saved when there is audio to save
+    if save_file is not None:
+        if audio_data is None:
+            save_file.write_bytes.assert_not_called()
+        else:
+            save_file.write_bytes.assert_called_once_with(audio_data)
+
 
 @pytest.mark.asyncio
-@patch("agent_cli.agents._tts_common.tts.speak_text", new_callable=AsyncMock)
-async def test_handle_tts_playback_with_save_file(
-    mock_speak_text: AsyncMock,
-    tmp_path: Path,
-) -> None:
-    """Test the handle_tts_playback function with file saving."""
-    mock_speak_text.return_value = b"audio data"
-    save_file = tmp_path / "test.wav"
-    mock_live = MagicMock()
+async def test_save_audio_file_os_error() -> None:
+    """Test _save_audio_file with OSError."""
+    save_file = MagicMock(spec=Path)
+    save_file.write_bytes.side_effect = OSError("Permission denied")
 
-    await handle_tts_playback(
-        text="hello",
-        tts_server_ip="localhost",
-        tts_server_port=1234,
-        voice_name="test-voice",
-        tts_language="en",
-        speaker=None,
-        output_device_index=1,
-        save_file=save_file,
+    await _save_audio_file(
+        b"audio data",
+        save_file,
         quiet=False,
-        logger=MagicMock(),
-        play_audio=True,
-        speed=1.0,
-        live=mock_live,
+        logger=LOGGER,
     )
 
-    # Verify the file was saved
-    assert save_file.exists()
-    assert save_file.read_bytes() == b"audio data"
+    save_file.write_bytes.assert_called_once_with(b"audio data")
 
 
 @pytest.mark.asyncio
 @patch("agent_cli.agents._tts_common.tts.speak_text", new_callable=AsyncMock)
-async def test_handle_tts_playback_no_audio(mock_speak_text: AsyncMock) -> None:
-    """Test the handle_tts_playback function when no audio is returned."""
-    mock_speak_text.return_value = None
+async def test_handle_tts_playback_os_error(mock_speak_text: AsyncMock) -> None:
+    """Test handle_tts_playback with OSError."""
+    mock_speak_text.side_effect = OSError("Connection error")
     mock_live = MagicMock()
-    await handle_tts_playback(
+
+    result = await handle_tts_playback(
         text="hello",
         tts_server_ip="localhost",
         tts_server_port=1234,
-        voice_name="test-voice",
-        tts_language="en",
+        voice_name=None,
+        tts_language=None,
         speaker=None,
-        output_device_index=1,
+        output_device_index=None,
         save_file=None,
         quiet=False,
-        logger=MagicMock(),
-        play_audio=True,
-        speed=1.0,
+        logger=LOGGER,
         live=mock_live,
     )
 
-    mock_speak_text.assert_called_once()
+    assert result is None
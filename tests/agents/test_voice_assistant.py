@@ -2,40 +2,50 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 from typer.testing import CliRunner
 
 from agent_cli.cli import app
+from tests.mocks.stubs import AsyncStub
 
 runner = CliRunner()
 
 
-@patch("agent_cli.agents.voice_assistant.asr.transcribe_audio", new_callable=AsyncMock)
-@patch("agent_cli.agents.voice_assistant.process_and_update_clipboard", new_callable=AsyncMock)
 @patch("agent_cli.agents.voice_assistant.pyaudio_context")
 @patch("agent_cli.agents.voice_assistant.get_clipboard_text")
 def test_voice_assistant_agent(
     mock_get_clipboard_text: MagicMock,
     mock_pyaudio_context: MagicMock,
-    mock_process_and_update_clipboard: AsyncMock,
-    mock_transcribe_audio: AsyncMock,
 ) -> None:
     """Test the voice assistant agent."""
     mock_get_clipboard_text.return_value = "hello"
-    mock_transcribe_audio.return_value = "world"
-    result = runner.invoke(app, ["voice-assistant", "--config", "missing.toml"])
+    transcribe_audio = AsyncStub("world")
+    process_and_update_clipboard = AsyncStub()
+    with (
+        patch("agent_cli.agents.voice_assistant.asr.transcribe_audio", transcribe_audio),
+        patch(
+            "agent_cli.agents.voice_assistant.process_and_update_clipboard",
+            process_and_update_clipboard,
+        ),
+    ):
+        result = runner.invoke(
+            app,
+            ["voice-assistant", "--config", "missing.toml"],
+            catch_exceptions=False,
+        )
     assert result.exit_code == 0
     mock_pyaudio_context.assert_called_once()
-    mock_process_and_update_clipboard.assert_called_once()
-    mock_transcribe_audio.assert_called_once()
+    assert len(process_and_update_clipboard.calls) == 1
+    assert len(transcribe_audio.calls) == 1
+    assert process_and_update_clipboard.calls[0][1]["instruction"] == "world"
 
 
 @patch("agent_cli.agents.voice_assistant.process_manager.kill_process")
 def test_voice_assistant_stop(mock_kill_process: MagicMock) -> None:
     """Test the --stop flag."""
     mock_kill_process.return_value = True
-    result = runner.invoke(app, ["voice-assistant", "--stop"])
+    result = runner.invoke(app, ["voice-assistant", "--stop"], catch_exceptions=False)
     assert result.exit_code == 0
     assert "Voice assistant stopped" in result.stdout
     mock_kill_process.assert_called_once_with("voice-assistant")
@@ -45,7 +55,7 @@ def test_voice_assistant_stop(mock_kill_process: MagicMock) -> None:
 def test_voice_assistant_stop_not_running(mock_kill_process: MagicMock) -> None:
     """Test the --stop flag when the process is not running."""
     mock_kill_process.return_value = False
-    result = runner.invoke(app, ["voice-assistant", "--stop"])
+    result = runner.invoke(app, ["voice-assistant", "--stop"], catch_exceptions=False)
     assert result.exit_code == 0
     assert "No voice assistant is running" in result.stdout
 
@@ -58,7 +68,7 @@ def test_voice_assistant_status_running(mock_is_process_running: MagicMock) -> N
         "agent_cli.agents.voice_assistant.process_manager.read_pid_file",
         return_value=123,
     ):
-        result = runner.invoke(app, ["voice-assistant", "--status"])
+        result = runner.invoke(app, ["voice-assistant", "--status"], catch_exceptions=False)
     assert result.exit_code == 0
     assert "Voice assistant is running" in result.stdout
 
@@ -67,6 +77,6 @@ def test_voice_assistant_status_running(mock_is_process_running: MagicMock) -> N
 def test_voice_assistant_status_not_running(mock_is_process_running: MagicMock) -> None:
     """Test the --status flag when the process is not running."""
     mock_is_process_running.return_value = False
-    result = runner.invoke(app, ["voice-assistant", "--status"])
+    result = runner.invoke(app, ["voice-assistant", "--status"], catch_exceptions=False)
     assert result.exit_code == 0
     assert "Voice assistant is not running" in result.stdout
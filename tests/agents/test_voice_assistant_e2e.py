@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING
-from unittest.mock import MagicMock, patch
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -16,104 +18,150 @@ from agent_cli.agents._config import (
     TTSConfig,
 )
 from agent_cli.agents.voice_assistant import async_main
-from tests.mocks.audio import MockPyAudio
+from agent_cli.utils import InteractiveStopEvent
 from tests.mocks.llm import MockLLMAgent
 from tests.mocks.wyoming import MockASRClient, MockTTSClient
 
 if TYPE_CHECKING:
+    from collections.abc import Generator, Mapping
+
     from rich.console import Console
 
+    from tests.mocks.audio import MockPyAudio
 
-@pytest.mark.asyncio
-@patch("agent_cli.tts.pyaudio_context")
-@patch("agent_cli.llm.pyperclip.copy")
-@patch("agent_cli.agents.voice_assistant.pyperclip")
-@patch("agent_cli.agents.voice_assistant.pyaudio_context")
-@patch("agent_cli.agents.voice_assistant.signal_handling_context")
-@patch("agent_cli.tts.AsyncClient")
-@patch("agent_cli.asr.AsyncClient")
-@patch("agent_cli.llm.build_agent")
-async def test_voice_assistant_e2e(
-    mock_build_agent: MagicMock,
-    mock_asr_client_class: MagicMock,
-    mock_tts_client_class: MagicMock,
-    mock_signal_handling_context: MagicMock,
-    mock_pyaudio_context_asr: MagicMock,
-    mock_pyperclip: MagicMock,
-    mock_llm_pyperclip_copy: MagicMock,
-    mock_pyaudio_context_tts: MagicMock,
-    mock_pyaudio_device_info: list[dict],
-    llm_responses: dict[str, str],
-    mock_console: Console,
-) -> None:
-    """Test end-to-end voice assistant functionality with simplified mocks."""
-    # Setup mock PyAudio
-    mock_pyaudio_instance = MockPyAudio(mock_pyaudio_device_info)
-    mock_pyaudio_context_asr.return_value.__enter__.return_value = mock_pyaudio_instance
-    mock_pyaudio_context_tts.return_value.__enter__.return_value = mock_pyaudio_instance
-
-    # Setup mock LLM agent
-    mock_llm_agent = MockLLMAgent(llm_responses)
-    mock_build_agent.return_value = mock_llm_agent
-
-    # Setup mock Wyoming clients
-    mock_asr_client = MockASRClient("this is a test")
-    mock_tts_client = MockTTSClient(b"fake audio data")
-    mock_asr_client_class.from_uri.return_value = mock_asr_client
-    mock_tts_client_class.from_uri.return_value.__aenter__.return_value = mock_tts_client
-
-    # Setup stop event
-    stop_event = asyncio.Event()
-    mock_signal_handling_context.return_value.__enter__.return_value = stop_event
-    asyncio.get_event_loop().call_later(0.1, stop_event.set)
-    mock_pyperclip.paste.return_value = "this is the llm response"
-
-    with patch(
-        "agent_cli.agents.voice_assistant.get_clipboard_text",
-        return_value="test clipboard text",
-    ):
+
+@dataclass
+class VoiceAssistantHarness:
+    """Patched collaborators of the voice assistant plus a runner with default configs."""
+
+    mocks: SimpleNamespace
+    console: Console
+
+    async def run(self, **overrides: Any) -> None:
+        """Run `async_main`, overriding any of the `TTSConfig` fields."""
         general_cfg = GeneralConfig(
             log_level="INFO",
             log_file=None,
             quiet=False,
             clipboard=True,
         )
-        general_cfg.__dict__["console"] = mock_console
-        asr_config = ASRConfig(
-            server_ip="mock-asr-host",
-            server_port=10300,
-            input_device_index=0,
-            input_device_name=None,
-            list_input_devices=False,
-        )
-        llm_config = LLMConfig(model="test-model", ollama_host="http://localhost:11434")
-        tts_config = TTSConfig(
-            enabled=True,
-            server_ip="mock-tts-host",
-            server_port=10200,
-            voice_name=None,
-            language=None,
-            speaker=None,
-            output_device_index=None,
-            output_device_name=None,
-            list_output_devices=False,
-            speed=1.0,
-        )
-        file_config = FileConfig(save_file=None)
-
+        general_cfg.__dict__["console"] = self.console
+        tts_fields: dict[str, Any] = {
+            "enabled": True,
+            "server_ip": "mock-tts-host",
+            "server_port": 10200,
+            "voice_name": None,
+            "language": None,
+            "speaker": None,
+            "output_device_index": None,
+            "output_device_name": None,
+            "list_output_devices": False,
+            "speed": 1.0,
+        }
         await async_main(
             general_cfg=general_cfg,
-            asr_config=asr_config,
-            llm_config=llm_config,
-            tts_config=tts_config,
-            file_config=file_config,
+            asr_config=ASRConfig(
+                server_ip="mock-asr-host",
+                server_port=10300,
+                input_device_index=0,
+                input_device_name=None,
+                list_input_devices=False,
+            ),
+            llm_config=LLMConfig(model="test-model", ollama_host="http://localhost:11434"),
+            tts_config=TTSConfig(**(tts_fields | overrides)),
+            file_config=FileConfig(save_file=None),
         )
 
-    # Assertions
-    mock_build_agent.assert_called_once()
-    mock_asr_client_class.from_uri.assert_called_once_with("tcp://mock-asr-host:10300")
-    mock_tts_client_class.from_uri.assert_called_once_with("tcp://mock-tts-host:10200")
-    assert mock_llm_agent.call_history
-    assert mock_pyaudio_instance.streams[1].get_written_data()
-    mock_pyperclip.paste.assert_called_once()
-    mock_llm_pyperclip_copy.assert_called_once()
+
+@pytest.fixture(scope="module")
+def voice_assistant_mocks(
+    _module_pyaudio: MockPyAudio,
+    llm_responses: Mapping[str, str],
+) -> Generator[SimpleNamespace, None, None]:
+    """Patch everything the voice assistant talks to, once for the whole module."""
+    mock_agent = MockLLMAgent(llm_responses)
+    asr_client = MockASRClient("this is a test")
+    tts_client = MockTTSClient(b"fake audio data")
+    with pytest.MonkeyPatch.context() as mp:
+
+        def install(target: str, **kwargs: Any) -> MagicMock:
+            mock = MagicMock(**kwargs)
+            mp.setattr(target, mock)
+            return mock
+
+        for target in (
+            "agent_cli.tts.pyaudio_context",
+            "agent_cli.agents.voice_assistant.pyaudio_context",
+        ):
+            install(target).return_value.__enter__.return_value = _module_pyaudio
+        install(
+            "agent_cli.agents.voice_assistant.get_clipboard_text",
+            return_value="test clipboard text",
+        )
+        mocks = SimpleNamespace(
+            mock_pyaudio=_module_pyaudio,
+            mock_agent=mock_agent,
+            mock_build_agent=install("agent_cli.llm.build_agent", return_value=mock_agent),
+            signal_handling_context=install(
+                "agent_cli.agents.voice_assistant.signal_handling_context",
+            ),
+            asr_client_class=install("agent_cli.asr.AsyncClient"),
+            tts_client_class=install("agent_cli.tts.AsyncClient"),
+            pyperclip=install("agent_cli.agents.voice_assistant.pyperclip"),
+            llm_pyperclip_copy=install("agent_cli.llm.pyperclip.copy"),
+            asr_client=asr_client,
+            tts_client=tts_client,
+        )
+        mocks.asr_client_class.from_uri.return_value = asr_client
+        mocks.tts_client_class.from_uri.return_value = tts_client
+        mocks.pyperclip.paste.return_value = "this is the llm response"
+        yield mocks
+
+
+@pytest.fixture
+def voice_assistant_harness(
+    voice_assistant_mocks: SimpleNamespace,
+    mock_console: Console,
+) -> VoiceAssistantHarness:
+    """Reset the module-wide mocks and stop recording after the first audio chunk."""
+    mocks = voice_assistant_mocks
+    for instance in (mocks.mock_pyaudio, mocks.mock_agent, mocks.asr_client, mocks.tts_client):
+        instance.reset()
+    for mock in (
+        mocks.mock_build_agent,
+        mocks.asr_client_class,
+        mocks.tts_client_class,
+        mocks.pyperclip,
+        mocks.llm_pyperclip_copy,
+    ):
+        mock.reset_mock()
+    stop_event = InteractiveStopEvent()
+    mocks.signal_handling_context.return_value.__enter__.return_value = stop_event
+    mocks.asr_client.on_audio_chunk = stop_event.set
+    return VoiceAssistantHarness(mocks=mocks, console=mock_console)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("tts_enabled", [True, False], ids=["tts", "no-tts"])
+async def test_voice_assistant_e2e(
+    voice_assistant_harness: VoiceAssistantHarness,
+    tts_enabled: bool,
+    timeout_seconds: float,
+) -> None:
+    """Test end-to-end voice assistant functionality with simplified mocks."""
+    harness = voice_assistant_harness
+    async with asyncio.timeout(timeout_seconds):
+        await harness.run(enabled=tts_enabled)
+
+    mocks = harness.mocks
+    mocks.mock_build_agent.assert_called_once()
+    mocks.asr_client_class.from_uri.assert_called_once_with("tcp://mock-asr-host:10300")
+    assert mocks.mock_agent.call_history
+    mocks.llm_pyperclip_copy.assert_called_once()
+    if tts_enabled:
+        mocks.tts_client_class.from_uri.assert_called_once_with("tcp://mock-tts-host:10200")
+        assert mocks.mock_pyaudio.streams[1].get_written_data()
+        mocks.pyperclip.paste.assert_called_once()
+    else:
+        mocks.tts_client_class.from_uri.assert_not_called()
+        mocks.pyperclip.paste.assert_not_called()
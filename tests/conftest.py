@@ -6,10 +6,29 @@ import asyncio
 import contextlib
 import io
 import logging
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
 
 import pytest
 from rich.console import Console
 
+from tests.mocks.audio import MockPyAudio
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping
+
+    ClientPatcher = Callable[[str, object], contextlib.AbstractContextManager[MagicMock]]
+
+
+def pytest_asyncio_loop_factories() -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Run async tests on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
 
 def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
     """Set default timeout for all tests."""
@@ -18,12 +37,19 @@ def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
             item.add_marker(pytest.mark.timeout(3))
 
 
-@pytest.fixture
-def mock_console() -> Console:
-    """Provide a console that writes to a StringIO for testing."""
+@pytest.fixture(scope="module")
+def _module_console() -> Console:
+    """Build the test console once per module."""
     return Console(file=io.StringIO(), width=80, force_terminal=True)
 
 
+@pytest.fixture
+def mock_console(_module_console: Console) -> Console:
+    """Provide a console that writes to a fresh StringIO for testing."""
+    _module_console.file = io.StringIO()
+    return _module_console
+
+
 @pytest.fixture
 def mock_logger() -> logging.Logger:
     """Provide a mock logger for testing."""
@@ -40,14 +66,14 @@ def stop_event() -> asyncio.Event:
 
 @pytest.fixture
 def timeout_seconds() -> float:
-    """Default timeout for async operations in tests."""
-    return 5.0
+    """Default timeout for async operations in tests, below the per-test pytest timeout."""
+    return 2.0
 
 
-@pytest.fixture
-def mock_pyaudio_device_info() -> list[dict]:
-    """Mock PyAudio device info for testing."""
-    return [
+@pytest.fixture(scope="session")
+def mock_pyaudio_device_info() -> tuple[Mapping[str, Any], ...]:
+    """Mock PyAudio device info for testing, read-only since it is shared by the session."""
+    devices = (
         {
             "index": 0,
             "name": "Mock Input Device",
@@ -69,15 +95,68 @@ def mock_pyaudio_device_info() -> list[dict]:
             "maxOutputChannels": 2,
             "defaultSampleRate": 44100.0,
         },
-    ]
+    )
+    return tuple(MappingProxyType(device) for device in devices)
+
+
+@pytest.fixture(scope="module")
+def _module_pyaudio(mock_pyaudio_device_info: tuple[Mapping[str, Any], ...]) -> MockPyAudio:
+    """Build the mock PyAudio instance once per module."""
+    return MockPyAudio(mock_pyaudio_device_info)
 
 
 @pytest.fixture
-def llm_responses() -> dict[str, str]:
-    """Predefined LLM responses for testing."""
-    return {
-        "correct": "This text has been corrected and improved.",
-        "hello": "Hello! How can I help you today?",
-        "question": "The meaning of life is 42, according to The Hitchhiker's Guide to the Galaxy.",
-        "default": "I understand your request and here is my response.",
-    }
+def mock_pyaudio(_module_pyaudio: MockPyAudio) -> MockPyAudio:
+    """Provide the module's mock PyAudio instance without any open streams."""
+    _module_pyaudio.reset()
+    return _module_pyaudio
+
+
+@pytest.fixture(scope="session")
+def llm_responses() -> MappingProxyType[str, str]:
+    """Predefined LLM responses for testing, read-only since they are shared by the session."""
+    return MappingProxyType(
+        {
+            "correct": "This text has been corrected and improved.",
+            "hello": "Hello! How can I help you today?",
+            "question": (
+                "The meaning of life is 42, according to The Hitchhiker's Guide to the Galaxy."
+            ),
+            "default": "I understand your request and here is my response.",
+        },
+    )
+
+
+@pytest.fixture(scope="session")
+def transcript_responses() -> MappingProxyType[str, str]:
+    """Predefined ASR transcripts for testing, read-only since they are shared by the session."""
+    return MappingProxyType(
+        {
+            "hello": "hello world",
+            "instruction": "this is a test",
+            "empty": "",
+        },
+    )
+
+
+@pytest.fixture(scope="session")
+def wyoming_client_patcher() -> ClientPatcher:
+    """Return a factory that makes ``<module>.AsyncClient.from_uri`` hand out a mock client.
+
+    Passing an exception instead of a client makes ``from_uri`` raise it. The
+    patch is undone when the returned context manager exits, so nothing leaks
+    into other tests.
+    """
+
+    @contextlib.contextmanager
+    def _patch_client(module: str, client: object) -> Iterator[MagicMock]:
+        mock_async_client_class = MagicMock()
+        if isinstance(client, BaseException):
+            mock_async_client_class.from_uri.side_effect = client
+        else:
+            mock_async_client_class.from_uri.return_value = client
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(f"{module}.AsyncClient", mock_async_client_class)
+            yield mock_async_client_class
+
+    return _patch_client
@@ -2,7 +2,17 @@
 
 from __future__ import annotations
 
-from typing import Any, Self
+from functools import cache
+from typing import TYPE_CHECKING, Any, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+
+@cache
+def _synthetic_frames(num_frames: int) -> bytes:
+    """Return 16-bit audio data for `num_frames`, built once per size."""
+    return b"\x00\x01" * num_frames
 
 
 class MockAudioStream:
@@ -17,7 +27,7 @@ class MockAudioStream:
 
     def read(self, num_frames: int, *, exception_on_overflow: bool = True) -> bytes:  # noqa: ARG002
         """Simulate reading from audio input device."""
-        return b"\x00\x01" * num_frames  # 16-bit audio data
+        return _synthetic_frames(num_frames)
 
     def write(self, frames: bytes) -> None:
         """Simulate writing to audio output device."""
@@ -51,16 +61,20 @@ class MockAudioStream:
 class MockPyAudio:
     """Mock PyAudio class for testing."""
 
-    def __init__(self, device_info: list[dict[str, Any]]) -> None:
+    def __init__(self, device_info: Sequence[Mapping[str, Any]]) -> None:
         """Initialize mock PyAudio with device information."""
         self.device_info = device_info
         self.streams: list[MockAudioStream] = []
 
+    def reset(self) -> None:
+        """Forget all opened streams so the instance can be reused by another test."""
+        self.streams.clear()
+
     def get_device_count(self) -> int:
         """Get number of audio devices."""
         return len(self.device_info)
 
-    def get_device_info_by_index(self, input_device_index: int) -> dict[str, Any]:
+    def get_device_info_by_index(self, input_device_index: int) -> Mapping[str, Any]:
         """Get device info by index."""
         if 0 <= input_device_index < len(self.device_info):
             return self.device_info[input_device_index]
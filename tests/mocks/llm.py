@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable
+    from collections.abc import Awaitable, Mapping
 
 
 class MockLLMResult:
@@ -19,7 +19,7 @@ class MockLLMResult:
 class MockLLMAgent:
     """Mock LLM agent for testing without real API calls."""
 
-    def __init__(self, responses: dict[str, str]) -> None:
+    def __init__(self, responses: Mapping[str, str]) -> None:
         """Initialize mock agent.
 
         Args:
@@ -27,8 +27,20 @@ class MockLLMAgent:
 
         """
         self.responses = responses
+        # Lowercase the patterns once, longest first so the most specific pattern wins
+        self._lowercase_patterns = tuple(
+            sorted(
+                ((pattern.lower(), response) for pattern, response in responses.items()),
+                key=lambda item: len(item[0]),
+                reverse=True,
+            ),
+        )
         self.call_history: list[dict[str, Any]] = []
 
+    def reset(self) -> None:
+        """Forget previous calls so the agent can be reused by another test."""
+        self.call_history.clear()
+
     def run(self, user_prompt: str) -> Awaitable[MockLLMResult]:
         """Mock execution of the agent."""
         self.call_history.append({"user_prompt": user_prompt})
@@ -42,7 +54,7 @@ class MockLLMAgent:
     def _get_response_for_prompt(self, prompt: str) -> str:
         """Get appropriate response for the given prompt."""
         prompt_lower = prompt.lower()
-        for pattern, response in self.responses.items():
-            if pattern.lower() in prompt_lower:
+        for pattern, response in self._lowercase_patterns:
+            if pattern in prompt_lower:
                 return response
         return self.responses.get("default", "Mock LLM response")
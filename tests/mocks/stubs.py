@@ -0,0 +1,56 @@
+"""Lightweight call-recording stubs for testing."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class AsyncStub:
+    """Async callable that records its calls and returns a fixed value.
+
+    A cheaper stand-in for `AsyncMock` where only the call arguments are asserted.
+    """
+
+    def __init__(self, return_value: Any = None) -> None:
+        """Initialize the stub with the value every call returns."""
+        self.return_value = return_value
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Record the call and return the configured value."""
+        self.calls.append((args, kwargs))
+        return self.return_value
+
+
+class StubStopEvent:
+    """Stand-in for `InteractiveStopEvent` that replays a fixed `is_set` sequence.
+
+    The last value repeats once the sequence is exhausted. `clear` calls are counted.
+    """
+
+    __slots__ = ("_index", "_values", "clear_count", "ctrl_c_pressed")
+
+    def __init__(self, values: Sequence[bool] = (False,)) -> None:
+        """Initialize the stub with the values `is_set` returns in order."""
+        self._values = list(values)
+        self._index = 0
+        self.clear_count = 0
+        self.ctrl_c_pressed = False
+
+    def is_set(self) -> bool:
+        """Return the next value in the sequence."""
+        value = self._values[min(self._index, len(self._values) - 1)]
+        self._index += 1
+        return value
+
+    def set(self) -> None:
+        """Make every following `is_set` call return True."""
+        self._values = [True]
+        self._index = 0
+
+    def clear(self) -> None:
+        """Count the call without changing the sequence."""
+        self.clear_count += 1
@@ -5,59 +5,86 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Self
 
 from wyoming.asr import Transcript
-from wyoming.audio import AudioChunk
+from wyoming.audio import AudioChunk, AudioStart, AudioStop
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, Callable
 
     from wyoming.event import Event
 
+_TTS_AUDIO_START = AudioStart(rate=22050, width=2, channels=1).event()
+_TTS_AUDIO_STOP = AudioStop().event()
+
 
 class MockWyomingClient:
     """Base class for mock Wyoming clients."""
 
+    _event_generator: AsyncGenerator[Event, None]
+
     def __init__(self) -> None:
         """Initialize mock client."""
         self.events_written: list[Event] = []
         self.is_active = True
 
+    def reset(self) -> None:
+        """Reset the client so it can be reused by another test."""
+        self.events_written.clear()
+        self.is_active = True
+
     async def write_event(self, event: Event) -> None:
         """Mock writing an event."""
         if self.is_active:
             self.events_written.append(event)
 
     async def read_event(self) -> Event | None:
-        """Mock reading an event."""
+        """Mock reading events from the server."""
+        return await anext(self._event_generator, None)
+
+    def _generate_events(self) -> AsyncGenerator[Event, None]:
+        """Generate the events the server sends back."""
         raise NotImplementedError
 
     async def __aenter__(self) -> Self:
-        """Async context manager entry."""
+        """Async context manager entry, starting a fresh stream of server events."""
+        self._event_generator = self._generate_events()
         return self
 
     async def __aexit__(self, *args: object) -> None:
         """Async context manager exit."""
+        await self._event_generator.aclose()
         self.is_active = False
 
 
 class MockASRClient(MockWyomingClient):
     """Mock Wyoming ASR client for testing transcription."""
 
-    def __init__(self, transcript_text: str) -> None:
-        """Initialize mock ASR client."""
+    def __init__(
+        self,
+        transcript_text: str,
+        *,
+        on_audio_chunk: Callable[[], object] | None = None,
+    ) -> None:
+        """Initialize mock ASR client.
+
+        Args:
+            transcript_text: Text returned in the transcript event
+            on_audio_chunk: Called for every audio chunk written, e.g. to stop recording
+
+        """
         super().__init__()
         self.transcript_text = transcript_text
-        self._event_generator = self._generate_events()
+        self._transcript_event = Transcript(text=transcript_text).event()
+        self.on_audio_chunk = on_audio_chunk
 
-    async def read_event(self) -> Event | None:
-        """Mock reading events from the server."""
-        try:
-            return await self._event_generator.__anext__()
-        except StopAsyncIteration:
-            return None
+    async def write_event(self, event: Event) -> None:
+        """Mock writing an event, signalling each audio chunk."""
+        await super().write_event(event)
+        if self.on_audio_chunk is not None and AudioChunk.is_type(event.type):
+            self.on_audio_chunk()
 
     async def _generate_events(self) -> AsyncGenerator[Event, None]:
         """Generate transcript events."""
-        yield Transcript(text=self.transcript_text).event()
+        yield self._transcript_event
 
 
 class MockTTSClient(MockWyomingClient):
@@ -67,27 +94,17 @@ class MockTTSClient(MockWyomingClient):
         """Initialize mock TTS client."""
         super().__init__()
         self.audio_data = audio_data
-        self._event_generator = self._generate_events()
-
-    async def read_event(self) -> Event | None:
-        """Mock reading events from the server."""
-        try:
-            return await self._event_generator.__anext__()
-        except StopAsyncIteration:
-            return None
 
     async def _generate_events(self) -> AsyncGenerator[Event, None]:
         """Generate audio synthesis events."""
-        from wyoming.audio import AudioStart, AudioStop
-
-        yield AudioStart(rate=22050, width=2, channels=1).event()
+        yield _TTS_AUDIO_START
         yield AudioChunk(
             rate=22050,
             width=2,
             channels=1,
             audio=self.audio_data,
         ).event()
-        yield AudioStop().event()
+        yield _TTS_AUDIO_STOP
 
     async def connect(self) -> None:
         """Mock connect."""
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+from typing import TYPE_CHECKING, cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,6 +12,14 @@ from wyoming.asr import Transcribe, Transcript, TranscriptChunk
 from wyoming.audio import AudioChunk, AudioStart, AudioStop
 
 from agent_cli import asr
+from agent_cli.utils import InteractiveStopEvent
+from tests.mocks.stubs import StubStopEvent
+
+if TYPE_CHECKING:
+    from tests.conftest import ClientPatcher
+
+TRANSCRIPT_EVENT = Transcript(text="test transcription").event()
+LOGGER = logging.getLogger(__name__)
 
 
 @pytest.mark.asyncio
@@ -18,17 +28,15 @@ async def test_send_audio() -> None:
     # Arrange
     client = AsyncMock()
     stream = MagicMock()
-    stop_event = MagicMock()
-    stop_event.is_set.side_effect = [False, True]  # Allow one iteration then stop
-    stop_event.ctrl_c_pressed = False
+    # Allow one iteration then stop
+    stop_event = cast("InteractiveStopEvent", StubStopEvent([False, True]))
 
     stream.read.return_value = b"fake_audio_chunk"
-    logger = MagicMock()
 
     # Act
     # No need to create a task and sleep, just await the coroutine.
     # The side_effect will stop the loop.
-    await asr.send_audio(client, stream, stop_event, logger, live=MagicMock(), quiet=False)
+    await asr.send_audio(client, stream, stop_event, LOGGER, live=MagicMock(), quiet=False)
 
     # Assert
     assert client.write_event.call_count == 4
@@ -57,14 +65,13 @@ async def test_receive_text() -> None:
         Transcript(text="hello world").event(),
         None,  # To stop the loop
     ]
-    logger = MagicMock()
     chunk_callback = MagicMock()
     final_callback = MagicMock()
 
     # Act
     result = await asr.receive_text(
         client,
-        logger,
+        LOGGER,
         chunk_callback=chunk_callback,
         final_callback=final_callback,
     )
@@ -76,48 +83,37 @@ async def test_receive_text() -> None:
 
 
 @pytest.mark.asyncio
-async def test_transcribe_audio() -> None:
+async def test_transcribe_audio(wyoming_client_patcher: ClientPatcher) -> None:
     """Test the main transcribe_audio function."""
     # Arrange
+    mock_client = AsyncMock()
+    mock_client.__aenter__.return_value = mock_client
+    mock_client.read_event.side_effect = [TRANSCRIPT_EVENT, None]
     with (
-        patch("agent_cli.asr.AsyncClient.from_uri") as mock_from_uri,
+        wyoming_client_patcher("agent_cli.asr", mock_client),
         patch(
             "agent_cli.audio.pyaudio_context",
         ) as mock_pyaudio_context,
     ):
-        mock_client = AsyncMock()
-        mock_client.read_event.side_effect = [
-            Transcript(text="test transcription").event(),
-            None,
-        ]
-        mock_from_uri.return_value.__aenter__.return_value = mock_client
-
         p = MagicMock()
         mock_pyaudio_context.return_value.__enter__.return_value = p
         stream = MagicMock()
         p.open.return_value.__enter__.return_value = stream
-        stop_event = MagicMock()
-        stop_event.is_set.return_value = False
-        stop_event.ctrl_c_pressed = False
-        logger = MagicMock()
+        # Signal the stop up front so send_audio finishes as soon as the transcript arrives
+        stop_event = InteractiveStopEvent()
+        stop_event.set()
 
         # Act
-        transcribe_task = asyncio.create_task(
-            asr.transcribe_audio(
-                "localhost",
-                12345,
-                0,
-                logger,
-                p,
-                stop_event,
-                quiet=True,
-                live=MagicMock(),
-            ),
+        result = await asr.transcribe_audio(
+            "localhost",
+            12345,
+            0,
+            LOGGER,
+            p,
+            stop_event,
+            quiet=True,
+            live=MagicMock(),
         )
-        # Simulate stopping after a brief period
-        await asyncio.sleep(0.01)
-        stop_event.is_set.return_value = True
-        result = await transcribe_task
 
         # Assert
         assert result == "test transcription"
@@ -125,31 +121,25 @@ async def test_transcribe_audio() -> None:
 
 
 @pytest.mark.asyncio
-async def test_transcribe_audio_connection_error() -> None:
+async def test_transcribe_audio_connection_error(wyoming_client_patcher: ClientPatcher) -> None:
     """Test the main transcribe_audio function with a connection error."""
     # Arrange
     with (
-        patch(
-            "agent_cli.asr.AsyncClient.from_uri",
-            side_effect=ConnectionRefusedError,
-        ),
+        wyoming_client_patcher("agent_cli.asr", ConnectionRefusedError()),
         patch("agent_cli.audio.pyaudio_context") as mock_pyaudio_context,
     ):
         p = MagicMock()
         mock_pyaudio_context.return_value.__enter__.return_value = p
         stream = MagicMock()
         p.open.return_value.__enter__.return_value = stream
-        stop_event = MagicMock()
-        stop_event.is_set.return_value = False
-        stop_event.ctrl_c_pressed = False
-        logger = MagicMock()
+        stop_event = cast("InteractiveStopEvent", StubStopEvent())
 
         # Act
         result = await asr.transcribe_audio(
             "localhost",
             12345,
             0,
-            logger,
+            LOGGER,
             p,
             stop_event,
             quiet=True,
@@ -158,3 +148,71 @@ async def test_transcribe_audio_connection_error() -> None:
 
         # Assert
         assert result is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("error", "message"),
+    [
+        (ConnectionRefusedError(), "ASR Connection refused."),
+        (ConnectionResetError("server went away"), "Transcription error: server went away"),
+    ],
+    ids=["refused", "reset"],
+)
+async def test_transcribe_audio_task_error(
+    wyoming_client_patcher: ClientPatcher,
+    error: Exception,
+    message: str,
+) -> None:
+    """Test that an error raised inside the send/receive tasks reaches the error handlers."""
+    mock_client = AsyncMock()
+    mock_client.__aenter__.return_value = mock_client
+    mock_client.read_event.side_effect = error
+    p = MagicMock()
+    stop_event = InteractiveStopEvent()
+    stop_event.set()
+    with (
+        wyoming_client_patcher("agent_cli.asr", mock_client),
+        patch("agent_cli.asr.print_error_message") as mock_print_error,
+    ):
+        result = await asr.transcribe_audio(
+            "localhost",
+            12345,
+            0,
+            LOGGER,
+            p,
+            stop_event,
+            quiet=False,
+            live=MagicMock(),
+        )
+
+    assert result is None
+    assert mock_print_error.call_args.args[0] == message
+
+
+@pytest.mark.asyncio
+async def test_transcribe_audio_server_disconnect_stops_recording(
+    wyoming_client_patcher: ClientPatcher,
+) -> None:
+    """Test that a dropped server connection stops the recording without a stop signal."""
+    mock_client = AsyncMock()
+    mock_client.__aenter__.return_value = mock_client
+    mock_client.read_event.return_value = None
+    p = MagicMock()
+    stop_event = InteractiveStopEvent()
+    with wyoming_client_patcher("agent_cli.asr", mock_client):
+        async with asyncio.timeout(1):
+            result = await asr.transcribe_audio(
+                "localhost",
+                12345,
+                0,
+                LOGGER,
+                p,
+                stop_event,
+                quiet=True,
+                live=MagicMock(),
+            )
+
+    assert result == ""
+    assert stop_event.is_set()
+    mock_client.write_event.assert_called_with(AudioStop().event())
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-from unittest.mock import Mock, patch
+import re
+from typing import TYPE_CHECKING, Any, cast
 
 import pytest
 
@@ -11,269 +11,129 @@ from agent_cli import audio
 from tests.mocks.audio import MockPyAudio
 
 if TYPE_CHECKING:
+    import io
+    from collections.abc import Callable, Iterator, Mapping
+
+    import pyaudio
     from rich.console import Console
 
 
-@pytest.fixture
-def mock_pyaudio_with_cache_clear() -> None:
-    """Clear the audio device cache before each test."""
+@pytest.fixture(autouse=True)
+def patched_pyaudio(mock_pyaudio: MockPyAudio, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make ``pyaudio.PyAudio()`` return the shared mock and start with an empty device cache."""
+    monkeypatch.setattr("agent_cli.audio.pyaudio.PyAudio", lambda: mock_pyaudio)
     audio.get_all_devices.cache_clear()
 
 
-@patch("agent_cli.audio.pyaudio.PyAudio")
-def test_get_all_devices_caching(
-    mock_pyaudio_class: Mock,
-    mock_pyaudio_device_info: list[dict],
-) -> None:
-    """Test that device enumeration is cached for performance."""
-    # Setup mock PyAudio
-    mock_pyaudio = MockPyAudio(mock_pyaudio_device_info)
-    mock_pyaudio_class.return_value = mock_pyaudio
-
-    with audio.pyaudio_context() as p:
-        # First call should hit PyAudio
-        devices1 = audio.get_all_devices(p)
-
-        # Second call should use cached results
-        devices2 = audio.get_all_devices(p)
-
-        # Results should be identical
-        assert devices1 == devices2
-        assert len(devices1) == len(mock_pyaudio_device_info)
-
-
-@patch("agent_cli.audio.pyaudio.PyAudio")
-def test_list_input_devices(
-    mock_pyaudio_class: Mock,
-    mock_console: Console,
-    mock_pyaudio_device_info: list[dict],
-) -> None:
-    """Test listing input devices."""
-    # Setup mock PyAudio
-    mock_pyaudio = MockPyAudio(mock_pyaudio_device_info)
-    mock_pyaudio_class.return_value = mock_pyaudio
-
-    with audio.pyaudio_context() as p:
-        # Test listing input devices
-        audio.list_input_devices(p, mock_console)
-
-    # Verify console output contains device information
-    # This is more of an integration test to ensure no exceptions are raised
+@pytest.fixture
+def p() -> Iterator[pyaudio.PyAudio]:
+    """Enter ``pyaudio_context`` for the duration of a test."""
+    with audio.pyaudio_context() as instance:
+        yield instance
 
 
-@patch("agent_cli.audio.pyaudio.PyAudio")
-def test_list_output_devices(
-    mock_pyaudio_class: Mock,
-    mock_console: Console,
-    mock_pyaudio_device_info: list[dict],
+def test_get_all_devices_caching(
+    p: pyaudio.PyAudio,
+    mock_pyaudio_device_info: tuple[Mapping[str, Any], ...],
 ) -> None:
-    """Test listing output devices."""
-    # Setup mock PyAudio
-    mock_pyaudio = MockPyAudio(mock_pyaudio_device_info)
-    mock_pyaudio_class.return_value = mock_pyaudio
-
-    with audio.pyaudio_context() as p:
-        # Test listing output devices
-        audio.list_output_devices(p, mock_console)
-
-    # Verify no exceptions are raised
-
-
-@patch("agent_cli.audio.pyaudio.PyAudio")
-def test_list_all_devices(
-    mock_pyaudio_class: Mock,
+    """Test that device enumeration is cached for performance."""
+    # First call should hit PyAudio
+    devices1 = audio.get_all_devices(p)
+
+    # Second call should use cached results
+    devices2 = audio.get_all_devices(p)
+
+    # Results should be identical
+    assert devices1 == devices2
+    assert len(devices1) == len(mock_pyaudio_device_info)
+
+
+@pytest.mark.parametrize(
+    ("list_devices", "required"),
+    [
+        (audio.list_input_devices, ("Mock Input Device", "Mock Combined Device")),
+        (audio.list_output_devices, ("Mock Output Device", "Mock Combined Device")),
+        (
+            audio.list_all_devices,
+            ("Mock Input Device", "Mock Output Device", "Mock Combined Device"),
+        ),
+    ],
+    ids=["input", "output", "all"],
+)
+def test_list_devices(
+    p: pyaudio.PyAudio,
     mock_console: Console,
-    mock_pyaudio_device_info: list[dict],
+    monkeypatch: pytest.MonkeyPatch,
+    list_devices: Callable[[pyaudio.PyAudio], None],
+    required: tuple[str, ...],
 ) -> None:
-    """Test listing all audio devices."""
-    # Setup mock PyAudio
-    mock_pyaudio = MockPyAudio(mock_pyaudio_device_info)
-    mock_pyaudio_class.return_value = mock_pyaudio
-
-    with audio.pyaudio_context() as p:
-        # Test listing all devices
-        audio.list_all_devices(p, mock_console)
-
-    # Verify no exceptions are raised
-
-
-@patch("agent_cli.audio.pyaudio.PyAudio")
-def test_input_device_by_index(
-    mock_pyaudio_class: Mock,
-    mock_pyaudio_device_info: list[dict],
+    """Test that listing devices prints every matching device."""
+    monkeypatch.setattr("agent_cli.audio.console", mock_console)
+    list_devices(p)
+
+    console_output = cast("io.StringIO", mock_console.file).getvalue()
+    missing = [name for name in required if name not in console_output]
+    assert not missing, missing
+
+
+@pytest.mark.parametrize(
+    ("direction", "select_by", "position"),
+    [
+        ("input", "index", 0),
+        ("input", "name", 0),
+        ("output", "index", 1),
+        ("output", "name", 1),
+    ],
+    ids=["input-by-index", "input-by-name", "output-by-index", "output-by-name"],
+)
+def test_device_selection(
+    p: pyaudio.PyAudio,
+    mock_pyaudio_device_info: tuple[Mapping[str, Any], ...],
+    direction: str,
+    select_by: str,
+    position: int,
 ) -> None:
-    """Test selecting input device by index."""
-    # Setup mock PyAudio
-    mock_pyaudio = MockPyAudio(mock_pyaudio_device_info)
-    mock_pyaudio_class.return_value = mock_pyaudio
-
-    with audio.pyaudio_context() as p:
-        # Test getting device by valid index
-        input_device_index, input_device_name = audio.input_device(
-            p,
-            input_device_name=None,
-            input_device_index=0,
-        )
-
-        # Should return the first input-capable device
-        expected_device = next(
-            dev for dev in mock_pyaudio_device_info if dev["maxInputChannels"] > 0
-        )
-
-        assert input_device_name == expected_device["name"]
-        assert input_device_index == expected_device["index"]
-
-
-@patch("agent_cli.audio.pyaudio.PyAudio")
-def test_input_device_by_name(
-    mock_pyaudio_class: Mock,
-    mock_pyaudio_device_info: list[dict],
+    """Test selecting input and output devices by index or by name."""
+    expected = mock_pyaudio_device_info[position]
+    find_device = audio.input_device if direction == "input" else audio.output_device
+    device_index, device_name = find_device(
+        p,
+        input_device_name=expected["name"] if select_by == "name" else None,
+        input_device_index=expected["index"] if select_by == "index" else None,
+    )
+
+    assert device_index == expected["index"]
+    assert device_name == expected["name"]
+
+
+@pytest.mark.parametrize(
+    ("direction", "device_name", "device_index", "match"),
+    [
+        ("input", None, 999, re.compile("Device index 999 not found")),
+        ("input", "NonExistentDevice", None, re.compile("No input device found")),
+        ("output", "NonExistentOutputDevice", None, re.compile("No output device found")),
+    ],
+    ids=["input-invalid-index", "input-invalid-name", "output-invalid-name"],
+)
+def test_device_selection_errors(
+    p: pyaudio.PyAudio,
+    direction: str,
+    device_name: str | None,
+    device_index: int | None,
+    match: re.Pattern[str],
 ) -> None:
-    """Test selecting input device by name."""
-    # Setup mock PyAudio
-    mock_pyaudio = MockPyAudio(mock_pyaudio_device_info)
-    mock_pyaudio_class.return_value = mock_pyaudio
-
-    with audio.pyaudio_context() as p:
-        # Find an input device to test with
-        input_device = next(dev for dev in mock_pyaudio_device_info if dev["maxInputChannels"] > 0)
-
-        # Test getting device by name
-        input_device_index, input_device_name = audio.input_device(
+    """Test error handling for unknown device indices and names."""
+    find_device = audio.input_device if direction == "input" else audio.output_device
+    with pytest.raises(ValueError, match=match):
+        find_device(
             p,
-            input_device_name=input_device["name"],
-            input_device_index=None,
+            input_device_name=device_name,
+            input_device_index=device_index,
         )
 
-        assert input_device_name == input_device["name"]
-        assert input_device_index == input_device["index"]
 
-
-@patch("agent_cli.audio.pyaudio.PyAudio")
-def test_output_device_by_index(
-    mock_pyaudio_class: Mock,
-    mock_pyaudio_device_info: list[dict],
-) -> None:
-    """Test selecting output device by index."""
-    # Setup mock PyAudio
-    mock_pyaudio = MockPyAudio(mock_pyaudio_device_info)
-    mock_pyaudio_class.return_value = mock_pyaudio
-
-    with audio.pyaudio_context() as p:
-        # Test getting device by valid index
-        input_device_index, input_device_name = audio.output_device(
-            p,
-            input_device_name=None,
-            input_device_index=1,
-        )
-
-        # Should return the device at index 1 if it has output channels
-        expected_device = next(
-            dev
-            for dev in mock_pyaudio_device_info
-            if dev["index"] == 1 and dev["maxOutputChannels"] > 0
-        )
-
-        assert input_device_name == expected_device["name"]
-        assert input_device_index == expected_device["index"]
-
-
-@patch("agent_cli.audio.pyaudio.PyAudio")
-def test_output_device_by_name(
-    mock_pyaudio_class: Mock,
-    mock_pyaudio_device_info: list[dict],
-) -> None:
-    """Test selecting output device by name."""
-    # Setup mock PyAudio
-    mock_pyaudio = MockPyAudio(mock_pyaudio_device_info)
-    mock_pyaudio_class.return_value = mock_pyaudio
-
-    with audio.pyaudio_context() as p:
-        # Find an output device to test with
-        output_device = next(
-            dev for dev in mock_pyaudio_device_info if dev["maxOutputChannels"] > 0
-        )
-
-        # Test getting device by name
-        input_device_index, input_device_name = audio.output_device(
-            p,
-            input_device_name=output_device["name"],
-            input_device_index=None,
-        )
-
-        assert input_device_name == output_device["name"]
-        assert input_device_index == output_device["index"]
-
-
-@patch("agent_cli.audio.pyaudio.PyAudio")
-def test_input_device_invalid_index(
-    mock_pyaudio_class: Mock,
-    mock_pyaudio_device_info: list[dict],
-) -> None:
-    """Test error handling for invalid device index."""
-    # Setup mock PyAudio
-    mock_pyaudio = MockPyAudio(mock_pyaudio_device_info)
-    mock_pyaudio_class.return_value = mock_pyaudio
-
-    # Try to get device with invalid index - should raise ValueError
-    with (
-        audio.pyaudio_context() as p,
-        pytest.raises(ValueError, match="Device index 999 not found"),
-    ):
-        audio.input_device(
-            p,
-            input_device_name=None,
-            input_device_index=999,
-        )
-
-
-@patch("agent_cli.audio.pyaudio.PyAudio")
-def test_input_device_invalid_name(
-    mock_pyaudio_class: Mock,
-    mock_pyaudio_device_info: list[dict],
-) -> None:
-    """Test error handling for invalid device name."""
-    # Setup mock PyAudio
-    mock_pyaudio = MockPyAudio(mock_pyaudio_device_info)
-    mock_pyaudio_class.return_value = mock_pyaudio
-
-    with audio.pyaudio_context() as p, pytest.raises(ValueError, match="No input device found"):
-        audio.input_device(
-            p,
-            input_device_name="NonExistentDevice",
-            input_device_index=None,
-        )
-
-
-@patch("agent_cli.audio.pyaudio.PyAudio")
-def test_output_device_invalid_name(
-    mock_pyaudio_class: Mock,
-    mock_pyaudio_device_info: list[dict],
-) -> None:
-    """Test error handling for invalid output device name."""
-    # Setup mock PyAudio
-    mock_pyaudio = MockPyAudio(mock_pyaudio_device_info)
-    mock_pyaudio_class.return_value = mock_pyaudio
-
-    # Try to get device with invalid name - should raise ValueError
-    with audio.pyaudio_context() as p, pytest.raises(ValueError, match="No output device found"):
-        audio.output_device(
-            p,
-            input_device_name="NonExistentOutputDevice",
-            input_device_index=None,
-        )
-
-
-@patch("agent_cli.audio.pyaudio.PyAudio")
-def test_pyaudio_context_manager(
-    mock_pyaudio_class: Mock,
-    mock_pyaudio_device_info: list[dict],
-) -> None:
+def test_pyaudio_context_manager() -> None:
     """Test PyAudio context manager."""
-    # Setup mock PyAudio
-    mock_pyaudio = MockPyAudio(mock_pyaudio_device_info)
-    mock_pyaudio_class.return_value = mock_pyaudio
-
     # Test context manager
     with audio.pyaudio_context() as p:
         assert p is not None
@@ -283,16 +143,8 @@ def test_pyaudio_context_manager(
     # (MockPyAudio doesn't track this, but real PyAudio would)
 
 
-@patch("agent_cli.audio.pyaudio.PyAudio")
-def test_open_pyaudio_stream_context_manager(
-    mock_pyaudio_class: Mock,
-    mock_pyaudio_device_info: list[dict],
-) -> None:
+def test_open_pyaudio_stream_context_manager() -> None:
     """Test PyAudio stream context manager."""
-    # Setup mock PyAudio
-    mock_pyaudio = MockPyAudio(mock_pyaudio_device_info)
-    mock_pyaudio_class.return_value = mock_pyaudio
-
     with audio.pyaudio_context() as p:
         # Test input stream
         with audio.open_pyaudio_stream(
@@ -315,10 +167,7 @@ def test_open_pyaudio_stream_context_manager(
             assert stream.is_output
 
 
-@patch("agent_cli.audio.pyaudio.PyAudio")
-def test_device_filtering_by_capabilities(
-    mock_pyaudio_class: Mock,
-) -> None:
+def test_device_filtering_by_capabilities(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that devices are properly filtered by input/output capabilities."""
     # Create devices with specific capabilities
     device_info = [
@@ -328,9 +177,8 @@ def test_device_filtering_by_capabilities(
         {"index": 3, "name": "Neither", "maxInputChannels": 0, "maxOutputChannels": 0},
     ]
 
-    # Setup mock PyAudio
-    mock_pyaudio = MockPyAudio(device_info)
-    mock_pyaudio_class.return_value = mock_pyaudio
+    filtered_pyaudio = MockPyAudio(device_info)
+    monkeypatch.setattr("agent_cli.audio.pyaudio.PyAudio", lambda: filtered_pyaudio)
 
     with audio.pyaudio_context() as p:
         # Test input device filtering
@@ -9,7 +9,6 @@ from unittest.mock import MagicMock, patch
 import pytest
 from click import Command, Option
 from typer import Context
-from typer.testing import CliRunner
 
 from agent_cli.cli import set_config_defaults
 from agent_cli.config_loader import load_config
@@ -17,11 +16,10 @@ from agent_cli.config_loader import load_config
 if TYPE_CHECKING:
     from pathlib import Path
 
-runner = CliRunner()
 
-
-@pytest.fixture
-def config_file(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def config_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the sample config once; the tests only read it."""
     config_content = """
 [defaults]
 model = "wildcard-model"
@@ -35,7 +33,7 @@ quiet = true
 model = "transcribe-model"
 clipboard = false
 """
-    config_path = tmp_path / "config.toml"
+    config_path = tmp_path_factory.mktemp("config") / "config.toml"
     config_path.write_text(config_content)
     return config_path
 
@@ -60,7 +58,7 @@ def test_config_loader_basic(config_file: Path) -> None:
     assert isinstance(config, dict)
 
 
-def test_config_loader_key_replacement(config_file: Path) -> None:
+def test_config_loader_key_replacement(tmp_path: Path) -> None:
     """Test that dashed keys are replaced with underscores."""
     # Add a config with dashed keys
     config_content = """
@@ -71,7 +69,7 @@ ollama-host = "http://example.com"
 [test-command]
 some-option = "value"
 """
-    config_path = config_file.parent / "dashed-config.toml"
+    config_path = tmp_path / "dashed-config.toml"
     config_path.write_text(config_content)
 
     config = load_config(str(config_path))
@@ -4,26 +4,22 @@ from __future__ import annotations
 
 import os
 import signal
-import tempfile
-from pathlib import Path
 from typing import TYPE_CHECKING
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from pathlib import Path
 
 import pytest
 
 from agent_cli import process_manager
 
 
-@pytest.fixture
-def temp_pid_dir(monkeypatch: pytest.MonkeyPatch) -> Generator[Path, None, None]:
-    """Create a temporary directory for PID files during testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        temp_path = Path(tmpdir)
-        monkeypatch.setattr(process_manager, "PID_DIR", temp_path)
-        yield temp_path
+@pytest.fixture(autouse=True)
+def temp_pid_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the PID directory at the test's temporary directory."""
+    monkeypatch.setattr(process_manager, "PID_DIR", tmp_path)
+    return tmp_path
 
 
 def test_get_pid_file(temp_pid_dir: Path) -> None:
@@ -100,9 +96,10 @@ def test_read_pid_file_current_process() -> None:
     assert process_manager.read_pid_file(process_name) == current_pid
 
 
-@patch("os.kill")
-def test_kill_process_success(mock_os_kill: MagicMock) -> None:
+def test_kill_process_success(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test successfully killing a process."""
+    mock_os_kill = MagicMock()
+    monkeypatch.setattr(os, "kill", mock_os_kill)
     process_name = "test-process"
     pid_file = process_manager.get_pid_file(process_name)
 
@@ -125,11 +122,9 @@ def test_kill_process_not_running() -> None:
     assert result is False
 
 
-@patch("os.kill", side_effect=ProcessLookupError)
-def test_kill_process_already_dead(
-    mock_os_kill: MagicMock,  # noqa: ARG001
-) -> None:
+def test_kill_process_already_dead(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test killing a process that is already dead (stale PID file)."""
+    monkeypatch.setattr(os, "kill", MagicMock(side_effect=ProcessLookupError))
     process_name = "test-process"
     pid_file = process_manager.get_pid_file(process_name)
 
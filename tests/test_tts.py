@@ -4,18 +4,34 @@ from __future__ import annotations
 
 import io
 import wave
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from agent_cli.tts import _apply_speed_adjustment, speak_text
+from tests.mocks.stubs import AsyncStub
+
+
+def _make_wav() -> bytes:
+    """Build a short 16 kHz mono WAV file."""
+    wav_data = io.BytesIO()
+    with wave.open(wav_data, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        wav_file.writeframes(b"\x00\x01" * 100)
+    return wav_data.getvalue()
+
+
+# Built once; every test wraps it in its own BytesIO
+WAV_DATA = _make_wav()
 
 
 @pytest.mark.asyncio
-@patch("agent_cli.tts.synthesize_speech", new_callable=AsyncMock)
-async def test_speak_text(mock_synthesize_speech: AsyncMock) -> None:
+async def test_speak_text(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test the speak_text function."""
-    mock_synthesize_speech.return_value = b"audio data"
+    synthesize_speech = AsyncStub(return_value=b"audio data")
+    monkeypatch.setattr("agent_cli.tts.synthesize_speech", synthesize_speech)
     audio_data = await speak_text(
         text="hello",
         tts_server_ip="localhost",
@@ -29,19 +45,13 @@ async def test_speak_text(mock_synthesize_speech: AsyncMock) -> None:
         live=MagicMock(),
     )
     assert audio_data == b"audio data"
+    [(_, kwargs)] = synthesize_speech.calls
+    assert kwargs["text"] == "hello"
 
 
 def test_apply_speed_adjustment_no_change() -> None:
     """Test that speed adjustment returns original data when speed is 1.0."""
-    # Create a simple WAV file
-    wav_data = io.BytesIO()
-    with wave.open(wav_data, "wb") as wav_file:
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(16000)
-        wav_file.writeframes(b"\x00\x01" * 100)  # Simple test data
-
-    original_data = io.BytesIO(wav_data.getvalue())
+    original_data = io.BytesIO(WAV_DATA)
     result_data, speed_changed = _apply_speed_adjustment(original_data, 1.0)
 
     # Should return the same BytesIO object and False for speed_changed
@@ -52,15 +62,7 @@ def test_apply_speed_adjustment_no_change() -> None:
 @patch("agent_cli.tts.has_audiostretchy", new=False)
 def test_apply_speed_adjustment_without_audiostretchy() -> None:
     """Test speed adjustment when AudioStretchy is not available."""
-    # Create a simple WAV file
-    wav_data = io.BytesIO()
-    with wave.open(wav_data, "wb") as wav_file:
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(16000)
-        wav_file.writeframes(b"\x00\x01" * 100)
-
-    original_data = io.BytesIO(wav_data.getvalue())
+    original_data = io.BytesIO(WAV_DATA)
     result_data, speed_changed = _apply_speed_adjustment(original_data, 2.0)
 
     # Should return the same BytesIO object and False for speed_changed
@@ -72,15 +74,7 @@ def test_apply_speed_adjustment_without_audiostretchy() -> None:
 @patch("audiostretchy.stretch.AudioStretch")
 def test_apply_speed_adjustment_with_audiostretchy(mock_audio_stretch_class: MagicMock) -> None:
     """Test speed adjustment with AudioStretchy available."""
-    # Create a simple WAV file
-    wav_data = io.BytesIO()
-    with wave.open(wav_data, "wb") as wav_file:
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(16000)
-        wav_file.writeframes(b"\x00\x01" * 100)
-
-    original_data = io.BytesIO(wav_data.getvalue())
+    original_data = io.BytesIO(WAV_DATA)
 
     # Mock AudioStretchy behavior
     mock_audio_stretch = MagicMock()